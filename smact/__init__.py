@@ -7,6 +7,7 @@ A collection of fast screening tools from elemental data
 from __future__ import annotations
 
 import itertools
+import sys
 import warnings
 from math import gcd
 from operator import mul as multiply
@@ -113,6 +114,10 @@ class Element:
             oxi_states_custom_filepath (str): Path to custom oxidation states file
 
         """
+        # Interned symbols hit the pointer-equality fast path in the
+        # data_loader caches, whose keys are interned at load time.
+        symbol = sys.intern(str(symbol))
+
         # Get the oxidation states from the custom file if it exists
         if oxi_states_custom_filepath:
             try:
@@ -149,7 +154,7 @@ class Element:
         sse_Pauling_data = data_loader.lookup_element_sse_pauling_data(symbol)
         sse_Pauling = sse_Pauling_data["SolidStateEnergyPauling"] if sse_Pauling_data else None
 
-        magpie_data = data_loader.lookup_element_magpie_data(symbol)
+        magpie_data = data_loader.lookup_element_magpie_data(symbol, copy=False)
         if magpie_data:
             mendeleev = magpie_data["MendeleevNumber"]
             AtomicWeight = magpie_data["AtomicWeight"]
@@ -161,7 +166,7 @@ class Element:
             MeltingT = None
             num_valence = None
 
-        valence_data = data_loader.lookup_element_valence_data(symbol)
+        valence_data = data_loader.lookup_element_valence_data(symbol, copy=False)
         num_valence_modified = valence_data["NValence"] if valence_data else None
 
         for attribute, value in (
@@ -291,10 +296,10 @@ class Species(Element):
         self.shannon_radius = None
 
         if radii_source == "shannon":
-            shannon_data = data_loader.lookup_element_shannon_radius_data(symbol)
+            shannon_data = data_loader.lookup_element_shannon_radius_data(symbol, copy=False)
 
         elif radii_source == "extended":
-            shannon_data = data_loader.lookup_element_shannon_radius_data_extendedML(symbol)
+            shannon_data = data_loader.lookup_element_shannon_radius_data_extendedML(symbol, copy=False)
 
         else:
             shannon_data = None
@@ -330,15 +335,7 @@ class Species(Element):
 
         # Get SSE_2015 (revised) for the oxidation state.
 
-        self.SSE_2015 = None
-
-        sse_2015_data = data_loader.lookup_element_sse2015_data(symbol)
-        if sse_2015_data:
-            for dataset in sse_2015_data:
-                if dataset["OxidationState"] == oxidation:
-                    self.SSE_2015 = dataset["SolidStateEnergy2015"]
-        else:
-            self.SSE_2015 = None
+        self.SSE_2015 = data_loader.lookup_element_sse2015(symbol, oxidation)
 
 
 def ordered_elements(x: int, y: int) -> list[str]:
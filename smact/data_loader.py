@@ -5,7 +5,7 @@ This module handles the loading of external data used to initialise the
 core smact.Element and smact.Species classes.  It implements a
 transparent data-caching system to avoid a large amount of I/O when
 naively constructing several of these objects.  It also implements a
-switchable system to print verbose warning messages about possible
+switchable system to log verbose warning messages about possible
 missing data (mainly for debugging purposes). In general these functions
 are used in the background and it is not necessary to use them directly.
 """
@@ -13,13 +13,32 @@ are used in the background and it is not necessary to use them directly.
 from __future__ import annotations
 
 import csv
+import functools
+import logging
 import os
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 
-import pandas as pd
+import numpy as np
 
 from smact import data_directory
 
-# Module-level switch: print "verbose" warning messages
+logger = logging.getLogger(__name__)
+
+# Paths to the bundled data files, resolved once at import.
+_HHI_PATH = os.path.join(data_directory, "hhi.txt")
+_ELEMENT_DATA_PATH = os.path.join(data_directory, "element_data.txt")
+_SHANNON_RADII_PATH = os.path.join(data_directory, "shannon_radii.csv")
+_SHANNON_RADII_EXTENDED_ML_PATH = os.path.join(data_directory, "shannon_radii_ML_extended.csv")
+_SSE_PATH = os.path.join(data_directory, "SSE.csv")
+_SSE_2015_PATH = os.path.join(data_directory, "SSE_2015.csv")
+_SSE_PAULING_PATH = os.path.join(data_directory, "SSE_Pauling.csv")
+_MAGPIE_PATH = os.path.join(data_directory, "magpie.csv")
+_VALENCE_PATH = os.path.join(data_directory, "element_valence_modified.csv")
+
+# Module-level switch: log "verbose" warning messages
 # about missing data.
 _print_warnings = False
 
@@ -28,30 +47,42 @@ def set_warnings(enable=True):
     """
     Set verbose warning messages on and off.
 
+    The warnings are emitted through the "smact.data_loader" logger.
     In order to see any of the warnings, this function needs to be
     called _before_ the first call to the smact.Element()
     constructor.
 
     Args:
     ----
-    enable (bool) : print verbose warning messages.
+    enable (bool) : log verbose warning messages.
 
     """
     global _print_warnings
     _print_warnings = enable
 
 
+@functools.lru_cache(maxsize=32)
+def _read_data_file(filename):
+    """Read the full contents of a data file, caching the text by path."""
+    with open(filename) as file:
+        return file.read()
+
+
 def _get_data_rows(filename):
     """Generator for datafile entries by row."""
-    with open(filename) as file:
-        for line in file:
-            line = line.strip()
-            if line[0] != "#":
-                yield line.split()
+    for line in _read_data_file(filename).splitlines():
+        items = line.split()
+        # Skip blank lines and comments
+        if items and not items[0].startswith("#"):
+            yield items
 
 
 def float_or_None(x):
     """Cast a string to a float or to a None."""
+    # "None" marks missing values in the data files: test for it
+    # directly rather than raising and catching a ValueError.
+    if x == "None":
+        return None
     try:
         return float(x)
     except ValueError:
@@ -59,22 +90,75 @@ def float_or_None(x):
 
 
 # Loader and cache for the element oxidation-state data.
-_el_ox_states = None
 
+# Data files for each named oxidation-state set, keyed as in
+# smact.screening.smact_filter's oxidation_states_set argument.
+_OXIDATION_STATES_PATHS = {
+    "smact14": os.path.join(data_directory, "oxidation_states.txt"),
+    "icsd16": os.path.join(data_directory, "oxidation_states_icsd.txt"),
+    "pymatgen_sp": os.path.join(data_directory, "oxidation_states_SP.txt"),
+    "wiki": os.path.join(data_directory, "oxidation_states_wiki.txt"),
+    "icsd24": os.path.join(data_directory, "oxidation_states_icsd24_filtered.txt"),
+}
+
+# Parsed oxidation-state tables, keyed by source.
+_el_ox_states = {}
+
+
+def _parse_oxidation_states(filename):
+    """Parse an oxidation-states file into a dictionary keyed by element symbol."""
+    data = {}
+    for items in _get_data_rows(filename):
+        data[sys.intern(items[0])] = tuple(int(oxidationState) for oxidationState in items[1:])
+    return data
+
+
+def _load_oxidation_states(source):
+    """Load and cache the oxidation-state table for a named source."""
+    table = _el_ox_states.get(source)
+    if table is None:
+        if source not in _OXIDATION_STATES_PATHS:
+            raise ValueError(
+                f"{source} is not a valid oxidation states set. Choose from: {', '.join(_OXIDATION_STATES_PATHS)}."
+            )
+        table = _parse_oxidation_states(_OXIDATION_STATES_PATHS[source])
+        _el_ox_states[source] = table
 
-def lookup_element_oxidation_states(symbol, copy=True):
+    return table
+
+
+def _lookup_oxidation_states(table, symbol, copy):
+    """Look up an element in a parsed oxidation-state table."""
+    oxidation_states = table.get(symbol)
+    if oxidation_states is not None:
+        if copy:
+            # The tables store tuples -> if copy is set, return them as
+            # a new list.  The elements are integers, which are "value
+            # types" in Python, so this is a deep copy.
+
+            return list(oxidation_states)
+        else:
+            return oxidation_states
+    else:
+        if _print_warnings:
+            logger.warning("Oxidation states for element %s not found.", symbol)
+        return None
+
+
+def lookup_element_oxidation_states_by_source(symbol, source="icsd24", copy=True):
     """
-    Retrieve a list of known oxidation states for an element.
-    The oxidation states list used is the SMACT default and
-    most exhaustive list.
+    Retrieve a list of known oxidation states for an element from a named set.
 
     Args:
     ----
         symbol (str) : the atomic symbol of the element to look up.
+        source (str) : the oxidation states set to use. One of
+            'smact14', 'icsd16', 'pymatgen_sp', 'wiki' or 'icsd24'
+            (default, as used for Element.oxidation_states).
         copy (Optional(bool)): if True (default), return a copy of the
-            oxidation-state list, rather than a reference to the cached
-            data -- only use copy=False in performance-sensitive code
-            and where the list will not be modified!
+            oxidation-state list; if False, return the cached tuple
+            of oxidation states, which avoids the copy in
+            performance-sensitive code.
 
     Returns:
     -------
@@ -83,77 +167,92 @@ def lookup_element_oxidation_states(symbol, copy=True):
             Returns None if oxidation states for the Element were not
             found in the external data.
 
+    Raises:
+    ------
+        ValueError: if source is not a known oxidation states set.
+
     """
-    global _el_ox_states
+    table = _el_ox_states.get(source) or _load_oxidation_states(source)
+    return _lookup_oxidation_states(table, symbol, copy)
 
-    if _el_ox_states is None:
-        _el_ox_states = {}
 
-        for items in _get_data_rows(os.path.join(data_directory, "oxidation_states.txt")):
-            _el_ox_states[items[0]] = [int(oxidationState) for oxidationState in items[1:]]
+def lookup_element_oxidation_states_many(symbols, source="icsd24", copy=True):
+    """
+    Retrieve the known oxidation states of several elements from a named set.
 
-    if symbol in _el_ox_states:
-        if copy:
-            # _el_ox_states stores lists -> if copy is set, make an implicit
-            # deep copy.  The elements of the lists are integers, which are
-            # "value types" in Python.
+    Args:
+    ----
+        symbols (iterable) : atomic symbols of the elements to look up.
+        source (str) : the oxidation states set to use, as for
+            lookup_element_oxidation_states_by_source.
+        copy (Optional(bool)): if True (default), return a copy of each
+            oxidation-state list; if False, return the cached tuples of
+            oxidation states, which avoids the copies in
+            performance-sensitive code.
 
-            return list(_el_ox_states[symbol])
-        else:
-            return _el_ox_states[symbol]
-    else:
-        if _print_warnings:
-            print(f"WARNING: Oxidation states for element {symbol} " "not found.")
-        return None
+    Returns:
+    -------
+        list: Oxidation states for each symbol, aligned with symbols.
+            An entry is None if the element was not found in the
+            external data.
 
+    Raises:
+    ------
+        ValueError: if source is not a known oxidation states set.
 
-_el_ox_states_icsd = None
+    """
+    table = _el_ox_states.get(source) or _load_oxidation_states(source)
+    return [_lookup_oxidation_states(table, symbol, copy) for symbol in symbols]
 
 
-def lookup_element_oxidation_states_icsd(symbol, copy=True):
+def lookup_element_oxidation_states(symbol, copy=True):
     """
     Retrieve a list of known oxidation states for an element.
-    The oxidation states list used contains only those found
-    in the ICSD (and judged to be non-spurious).
+    The oxidation states list used is the SMACT default and
+    most exhaustive list.
 
     Args:
     ----
         symbol (str) : the atomic symbol of the element to look up.
         copy (Optional(bool)): if True (default), return a copy of the
-            oxidation-state list, rather than a reference to the cached
-            data -- only use copy=False in performance-sensitive code
-            and where the list will not be modified!
+            oxidation-state list; if False, return the cached tuple
+            of oxidation states, which avoids the copy in
+            performance-sensitive code.
 
     Returns:
     -------
         list: List of known oxidation states for the element.
 
-            Return None if oxidation states for the Element were not
+            Returns None if oxidation states for the Element were not
             found in the external data.
 
     """
-    global _el_ox_states_icsd
+    return lookup_element_oxidation_states_by_source(symbol, "smact14", copy)
 
-    if _el_ox_states_icsd is None:
-        _el_ox_states_icsd = {}
 
-        for items in _get_data_rows(os.path.join(data_directory, "oxidation_states_icsd.txt")):
-            _el_ox_states_icsd[items[0]] = [int(oxidationState) for oxidationState in items[1:]]
-    if symbol in _el_ox_states_icsd:
-        if copy:
-            # _el_ox_states_icsd stores lists -> if copy is set, make an implicit
-            # deep copy. The elements of the lists are integers, which are
-            # "value types" in Python.
-            return list(_el_ox_states_icsd[symbol])
-        else:
-            return _el_ox_states_icsd[symbol]
-    else:
-        if _print_warnings:
-            print(f"WARNING: Oxidation states for element {symbol}" "not found.")
-        return None
+def lookup_element_oxidation_states_icsd(symbol, copy=True):
+    """
+    Retrieve a list of known oxidation states for an element.
+    The oxidation states list used contains only those found
+    in the ICSD (and judged to be non-spurious).
 
+    Args:
+    ----
+        symbol (str) : the atomic symbol of the element to look up.
+        copy (Optional(bool)): if True (default), return a copy of the
+            oxidation-state list; if False, return the cached tuple
+            of oxidation states, which avoids the copy in
+            performance-sensitive code.
 
-_el_ox_states_sp = None
+    Returns:
+    -------
+        list: List of known oxidation states for the element.
+
+            Return None if oxidation states for the Element were not
+            found in the external data.
+
+    """
+    return lookup_element_oxidation_states_by_source(symbol, "icsd16", copy)
 
 
 def lookup_element_oxidation_states_sp(symbol, copy=True):
@@ -166,9 +265,9 @@ def lookup_element_oxidation_states_sp(symbol, copy=True):
     ----
         symbol (str) : the atomic symbol of the element to look up.
         copy (Optional(bool)): if True (default), return a copy of the
-            oxidation-state list, rather than a reference to the cached
-            data -- only use copy=False in performance-sensitive code
-            and where the list will not be modified!
+            oxidation-state list; if False, return the cached tuple
+            of oxidation states, which avoids the copy in
+            performance-sensitive code.
 
     Returns:
     -------
@@ -178,30 +277,7 @@ def lookup_element_oxidation_states_sp(symbol, copy=True):
             found in the external data.
 
     """
-    global _el_ox_states_sp
-
-    if _el_ox_states_sp is None:
-        _el_ox_states_sp = {}
-
-        for items in _get_data_rows(os.path.join(data_directory, "oxidation_states_SP.txt")):
-            _el_ox_states_sp[items[0]] = [int(oxidationState) for oxidationState in items[1:]]
-
-    if symbol in _el_ox_states_sp:
-        if copy:
-            # _el_ox_states_sp stores lists -> if copy is set, make an implicit
-            # deep copy.  The elements of the lists are integers, which are
-            # "value types" in Python.
-
-            return list(_el_ox_states_sp[symbol])
-        else:
-            return _el_ox_states_sp[symbol]
-    else:
-        if _print_warnings:
-            print(f"WARNING: Oxidation states for element {symbol} " "not found.")
-        return None
-
-
-_el_ox_states_wiki = None
+    return lookup_element_oxidation_states_by_source(symbol, "pymatgen_sp", copy)
 
 
 def lookup_element_oxidation_states_wiki(symbol, copy=True):
@@ -214,9 +290,9 @@ def lookup_element_oxidation_states_wiki(symbol, copy=True):
     ----
         symbol (str) : the atomic symbol of the element to look up.
         copy (Optional(bool)): if True (default), return a copy of the
-            oxidation-state list, rather than a reference to the cached
-            data -- only use copy=False in performance-sensitive code
-            and where the list will not be modified!
+            oxidation-state list; if False, return the cached tuple
+            of oxidation states, which avoids the copy in
+            performance-sensitive code.
 
     Returns:
     -------
@@ -226,30 +302,21 @@ def lookup_element_oxidation_states_wiki(symbol, copy=True):
             found in the external data.
 
     """
-    global _el_ox_states_wiki
-
-    if _el_ox_states_wiki is None:
-        _el_ox_states_wiki = {}
+    return lookup_element_oxidation_states_by_source(symbol, "wiki", copy)
 
-        for items in _get_data_rows(os.path.join(data_directory, "oxidation_states_wiki.txt")):
-            _el_ox_states_wiki[items[0]] = [int(oxidationState) for oxidationState in items[1:]]
 
-    if symbol in _el_ox_states_wiki:
-        if copy:
-            # _el_ox_states_wiki stores lists -> if copy is set, make an implicit
-            # deep copy.  The elements of the lists are integers, which are
-            # "value types" in Python.
+# Parsed user-supplied oxidation-state tables, keyed by file path.
+_el_ox_states_custom = {}
 
-            return list(_el_ox_states_wiki[symbol])
-        else:
-            return _el_ox_states_wiki[symbol]
-    else:
-        if _print_warnings:
-            print(f"WARNING: Oxidation states for element {symbol} " "not found.")
-        return None
 
+def _load_oxidation_states_custom(filepath):
+    """Load and cache oxidation states from a user-supplied file."""
+    table = _el_ox_states_custom.get(filepath)
+    if table is None:
+        table = _parse_oxidation_states(filepath)
+        _el_ox_states_custom[filepath] = table
 
-_el_ox_states_custom = None
+    return table
 
 
 def lookup_element_oxidation_states_custom(symbol, filepath, copy=True):
@@ -263,9 +330,9 @@ def lookup_element_oxidation_states_custom(symbol, filepath, copy=True):
         filepath (str) : the path to the text file containing the
             oxidation states data.
         copy (Optional(bool)): if True (default), return a copy of the
-            oxidation-state list, rather than a reference to the cached
-            data -- only use copy=False in performance-sensitive code
-            and where the list will not be modified!
+            oxidation-state list; if False, return the cached tuple
+            of oxidation states, which avoids the copy in
+            performance-sensitive code.
 
     Returns:
     -------
@@ -275,30 +342,7 @@ def lookup_element_oxidation_states_custom(symbol, filepath, copy=True):
             found in the external data.
 
     """
-    global _el_ox_states_custom
-
-    if _el_ox_states_custom is None:
-        _el_ox_states_custom = {}
-
-        for items in _get_data_rows(filepath):
-            _el_ox_states_custom[items[0]] = [int(oxidationState) for oxidationState in items[1:]]
-
-    if symbol in _el_ox_states_custom:
-        if copy:
-            # _el_ox_states_custom stores lists -> if copy is set, make an implicit
-            # deep copy.  The elements of the lists are integers, which are
-            # "value types" in Python.
-
-            return list(_el_ox_states_custom[symbol])
-        else:
-            return _el_ox_states_custom[symbol]
-    else:
-        if _print_warnings:
-            print(f"WARNING: Oxidation states for element {symbol} " "not found.")
-        return None
-
-
-_el_ox_states_icsd24 = None
+    return _lookup_oxidation_states(_load_oxidation_states_custom(filepath), symbol, copy)
 
 
 def lookup_element_oxidation_states_icsd24(symbol, copy=True):
@@ -310,9 +354,9 @@ def lookup_element_oxidation_states_icsd24(symbol, copy=True):
     Args:
         symbol (str) : the atomic symbol of the element to look up.
         copy (Optional(bool)): if True (default), return a copy of the
-            oxidation-state list, rather than a reference to the cached
-            data -- only use copy=False in performance-sensitive code
-            and where the list will not be modified!
+            oxidation-state list; if False, return the cached tuple
+            of oxidation states, which avoids the copy in
+            performance-sensitive code.
 
     Returns:
         list: List of known oxidation states for the element.
@@ -320,32 +364,28 @@ def lookup_element_oxidation_states_icsd24(symbol, copy=True):
             Returns None if oxidation states for the Element were not
             found in the external data.
     """
-    global _el_ox_states_icsd24
+    return lookup_element_oxidation_states_by_source(symbol, "icsd24", copy)
 
-    if _el_ox_states_icsd24 is None:
-        _el_ox_states_icsd24 = {}
 
-        for items in _get_data_rows(os.path.join(data_directory, "oxidation_states_icsd24_filtered.txt")):
-            _el_ox_states_icsd24[items[0]] = [int(oxidationState) for oxidationState in items[1:]]
+# Loader and cache for the element HHI scores.
 
-    if symbol in _el_ox_states_icsd24:
-        if copy:
-            # _el_ox_states_icsd24 stores lists -> if copy is set, make an implicit
-            # deep copy.  The elements of the lists are integers, which are
-            # "value types" in Python.
+_element_hhis = None
 
-            return list(_el_ox_states_icsd24[symbol])
-        else:
-            return _el_ox_states_icsd24[symbol]
-    else:
-        if _print_warnings:
-            print(f"WARNING: Oxidation states for element {symbol} " "not found.")
-        return None
 
+def _load_hhis():
+    """Load and cache the HHI scores."""
+    global _element_hhis
 
-# Loader and cache for the element HHI scores.
+    if _element_hhis is None:
+        data = {}
+        for items in _get_data_rows(_HHI_PATH):
+            data[sys.intern(items[0])] = (
+                float(items[1]),
+                float(items[2]),
+            )
+        _element_hhis = data
 
-_element_hhis = None
+    return _element_hhis
 
 
 def lookup_element_hhis(symbol):
@@ -364,28 +404,12 @@ def lookup_element_hhis(symbol):
             not found in the external data.
 
     """
-    global _element_hhis
-
-    if _element_hhis is None:
-        _element_hhis = {}
-
-        with open(os.path.join(data_directory, "hhi.txt")) as file:
-            for line in file:
-                line = line.strip()
-
-                if line[0] != "#":
-                    items = line.split()
-
-                    _element_hhis[items[0]] = (
-                        float(items[1]),
-                        float(items[2]),
-                    )
-
-    if symbol in _element_hhis:
-        return _element_hhis[symbol]
+    hhis = (_element_hhis or _load_hhis()).get(symbol)
+    if hhis is not None:
+        return hhis
     else:
         if _print_warnings:
-            print(f"WARNING: HHI data for element {symbol} not found.")
+            logger.warning("HHI data for element %s not found.", symbol)
 
         return None
 
@@ -395,32 +419,12 @@ def lookup_element_hhis(symbol):
 _element_data = None
 
 
-def lookup_element_data(symbol: str, copy: bool = True):
-    """
-    Retrieve tabulated data for an element.
-
-    The table "data/element_data.txt" contains a collection of relevant
-    atomic data. If a cache exists in the form of the module-level
-    variable _element_data, this is returned. Otherwise, a dictionary is
-    constructed from the data table and cached before returning it.
-
-    Args:
-    ----
-        symbol (str) : Atomic symbol for lookup
-        copy (bool) : if True (default), return a copy of the
-            data dictionary, rather than a reference to the cached
-            object -- only used copy=False in performance-sensitive code
-            and where you are certain the dictionary will not be
-            modified!
-
-    Returns:
-    -------
-        dict: Dictionary of data for given element, keyed by column headings from data/element_data.txt.
-
-    """
+def _load_element_data():
+    """Load and cache the tabulated elemental data."""
     global _element_data
+
     if _element_data is None:
-        _element_data = {}
+        data = {}
         keys = (
             "Symbol",
             "Name",
@@ -435,29 +439,57 @@ def lookup_element_data(symbol: str, copy: bool = True):
             "ion_pot",
             "dipol",
         )
-        for items in _get_data_rows(os.path.join(data_directory, "element_data.txt")):
+        for items in _get_data_rows(_ELEMENT_DATA_PATH):
             # First two columns are strings and should be left intact
             # Everything else is numerical and should be cast to a float
             # or, if not clearly a number, to None
             clean_items = items[0:2] + list(map(float_or_None, items[2:]))
 
-            _element_data.update({items[0]: dict(list(zip(keys, clean_items, strict=False)))})
+            # Store a read-only view, so that copy=False can safely
+            # hand out the cached entry itself.
+            data[sys.intern(items[0])] = MappingProxyType(dict(zip(keys, clean_items, strict=False)))
+        _element_data = data
+
+    return _element_data
+
+
+def lookup_element_data(symbol: str, copy: bool = True):
+    """
+    Retrieve tabulated data for an element.
+
+    The table "data/element_data.txt" contains a collection of relevant
+    atomic data. If a cache exists in the form of the module-level
+    variable _element_data, this is returned. Otherwise, a dictionary is
+    constructed from the data table and cached before returning it.
+
+    Args:
+    ----
+        symbol (str) : Atomic symbol for lookup
+        copy (bool) : if True (default), return a copy of the
+            data dictionary; if False, return a read-only view of the
+            cached object, which avoids the copy in
+            performance-sensitive code.
+
+    Returns:
+    -------
+        dict: Dictionary of data for given element, keyed by column headings from data/element_data.txt.
 
-    if symbol in _element_data:
+    """
+    dataset = (_element_data or _load_element_data()).get(symbol)
+    if dataset is not None:
         if copy:
-            # _element_open_babel_derived_data stores dictionaries
-            # -> if copy is set, use the dict.copy() function to return
-            # a copy. The values are all Python "value types", so
-            # explicitly cloning the elements is not necessary to make
-            # a deep copy.
+            # _element_data stores read-only mappings -> if copy is
+            # set, use their copy() method to return a plain dict. The
+            # values are all Python "value types", so explicitly
+            # cloning the elements is not necessary to make a deep
+            # copy.
 
-            return _element_data[symbol].copy()
+            return dataset.copy()
         else:
-            return _element_data[symbol]
+            return dataset
     else:
         if _print_warnings:
-            print(f"WARNING: Elemental data for {symbol} not found.")
-            print(_element_data)
+            logger.warning("Elemental data for %s not found.", symbol)
         return None
 
 
@@ -466,6 +498,49 @@ def lookup_element_data(symbol: str, copy: bool = True):
 _element_shannon_radii_data = None
 
 
+def _parse_shannon_radii(filename):
+    """Parse a Shannon radii file into lists of datasets keyed by element symbol."""
+    data = defaultdict(list)
+    reader = csv.reader(_read_data_file(filename).splitlines())
+
+    # Skip the first row (headers).
+
+    next(reader)
+
+    for row in reader:
+        # For the shannon radii, there are multiple datasets for
+        # different element/oxidation-state/coordination
+        # combinations.
+
+        dataset = MappingProxyType(
+            {
+                "charge": int(row[1]),
+                # The coordination and comment strings repeat across
+                # rows, so share one copy of each.
+                "coordination": sys.intern(row[2]),
+                "crystal_radius": float(row[3]),
+                "ionic_radius": float(row[4]),
+                "comment": sys.intern(row[5]),
+            }
+        )
+
+        data[sys.intern(row[0])].append(dataset)
+
+    # Return a plain dict, so that indexing a missing symbol raises a
+    # KeyError rather than inserting an empty list.
+    return dict(data)
+
+
+def _load_shannon_radii():
+    """Load and cache the Shannon radii datasets."""
+    global _element_shannon_radii_data
+
+    if _element_shannon_radii_data is None:
+        _element_shannon_radii_data = _parse_shannon_radii(_SHANNON_RADII_PATH)
+
+    return _element_shannon_radii_data
+
+
 def lookup_element_shannon_radius_data(symbol, copy=True):
     """
     Retrieve Shannon radii for known states of an element.
@@ -478,9 +553,9 @@ def lookup_element_shannon_radius_data(symbol, copy=True):
         symbol (str) : the atomic symbol of the element to look up.
 
         copy (Optional(bool)): if True (default), return a copy of the data
-        dictionary, rather than a reference to the cached object --
-        only use copy=False in performance-sensitive code and where
-        you are certain the dictionary will not be modified!
+        dictionaries; if False, return the cached list of read-only
+        views -- only use copy=False in performance-sensitive code and
+        where you are certain the list will not be modified!
 
     Returns:
     -------
@@ -504,51 +579,20 @@ def lookup_element_shannon_radius_data(symbol, copy=True):
             *str*
 
     """
-    global _element_shannon_radii_data
-
-    if _element_shannon_radii_data is None:
-        _element_shannon_radii_data = {}
-
-        with open(os.path.join(data_directory, "shannon_radii.csv")) as file:
-            reader = csv.reader(file)
-
-            # Skip the first row (headers).
-
-            next(reader)
-
-            for row in reader:
-                # For the shannon radii, there are multiple datasets for
-                # different element/oxidation-state/coordination
-                # combinations.
-
-                key = row[0]
-
-                dataset = {
-                    "charge": int(row[1]),
-                    "coordination": row[2],
-                    "crystal_radius": float(row[3]),
-                    "ionic_radius": float(row[4]),
-                    "comment": row[5],
-                }
-
-                if key in _element_shannon_radii_data:
-                    _element_shannon_radii_data[key].append(dataset)
-                else:
-                    _element_shannon_radii_data[key] = [dataset]
-
-    if symbol in _element_shannon_radii_data:
+    datasets = (_element_shannon_radii_data or _load_shannon_radii()).get(symbol)
+    if datasets is not None:
         if copy:
-            # _element_shannon_radii_data stores a list of dictionaries
-            # -> if copy is set, copy the list and use the dict.copy()
-            # function on each element.
+            # _element_shannon_radii_data stores a list of read-only mappings
+            # -> if copy is set, copy the list and turn each element
+            # back into a plain dictionary.
             # The dictionary values are all Python "value types", so
             # nothing further is required to make a deep copy.
-            return [item.copy() for item in _element_shannon_radii_data[symbol]]
+            return [dataset.copy() for dataset in datasets]
         else:
-            return _element_shannon_radii_data[symbol]
+            return datasets
     else:
         if _print_warnings:
-            print(f"WARNING: Shannon-radius data for element {symbol} not " "found.")
+            logger.warning("Shannon-radius data for element %s not found.", symbol)
 
         return None
 
@@ -558,6 +602,16 @@ def lookup_element_shannon_radius_data(symbol, copy=True):
 _element_shannon_radii_data_extendedML = None
 
 
+def _load_shannon_radii_extendedML():
+    """Load and cache the machine-learned extended Shannon radii datasets."""
+    global _element_shannon_radii_data_extendedML
+
+    if _element_shannon_radii_data_extendedML is None:
+        _element_shannon_radii_data_extendedML = _parse_shannon_radii(_SHANNON_RADII_EXTENDED_ML_PATH)
+
+    return _element_shannon_radii_data_extendedML
+
+
 def lookup_element_shannon_radius_data_extendedML(symbol, copy=True):
     """
     Retrieve the machine learned extended Shannon radii for
@@ -578,9 +632,9 @@ def lookup_element_shannon_radius_data_extendedML(symbol, copy=True):
         symbol (str) : the atomic symbol of the element to look up.
 
         copy (Optional(bool)): if True (default), return a copy of the data
-        dictionary, rather than a reference to the cached object --
-        only use copy=False in performance-sensitive code and where
-        you are certain the dictionary will not be modified!
+        dictionaries; if False, return the cached list of read-only
+        views -- only use copy=False in performance-sensitive code and
+        where you are certain the list will not be modified!
 
     Returns:
     -------
@@ -602,51 +656,20 @@ def lookup_element_shannon_radius_data_extendedML(symbol, copy=True):
             *str*
 
     """
-    global _element_shannon_radii_data_extendedML
-
-    if _element_shannon_radii_data_extendedML is None:
-        _element_shannon_radii_data_extendedML = {}
-
-        with open(os.path.join(data_directory, "shannon_radii_ML_extended.csv")) as file:
-            reader = csv.reader(file)
-
-            # Skip the first row (headers).
-
-            next(reader)
-
-            for row in reader:
-                # For the shannon radii, there are multiple datasets for
-                # different element/oxidation-state/coordination
-                # combinations.
-
-                key = row[0]
-
-                dataset = {
-                    "charge": int(row[1]),
-                    "coordination": row[2],
-                    "crystal_radius": float(row[3]),
-                    "ionic_radius": float(row[4]),
-                    "comment": row[5],
-                }
-
-                if key in _element_shannon_radii_data_extendedML:
-                    _element_shannon_radii_data_extendedML[key].append(dataset)
-                else:
-                    _element_shannon_radii_data_extendedML[key] = [dataset]
-
-    if symbol in _element_shannon_radii_data_extendedML:
+    datasets = (_element_shannon_radii_data_extendedML or _load_shannon_radii_extendedML()).get(symbol)
+    if datasets is not None:
         if copy:
-            # _element_shannon_radii_data_extendedML stores a list of dictionaries
-            # -> if copy is set, copy the list and use the dict.copy()
-            # function on each element.
+            # _element_shannon_radii_data_extendedML stores a list of read-only mappings
+            # -> if copy is set, copy the list and turn each element
+            # back into a plain dictionary.
             # The dictionary values are all Python "value types", so
             # nothing further is required to make a deep copy.
-            return [item.copy() for item in _element_shannon_radii_data_extendedML[symbol]]
+            return [dataset.copy() for dataset in datasets]
         else:
-            return _element_shannon_radii_data_extendedML[symbol]
+            return datasets
     else:
         if _print_warnings:
-            print(f"WARNING: Extended Shannon-radius data for element {symbol} not " "found.")
+            logger.warning("Extended Shannon-radius data for element %s not found.", symbol)
 
         return None
 
@@ -656,6 +679,32 @@ def lookup_element_shannon_radius_data_extendedML(symbol, copy=True):
 _element_ssedata = None
 
 
+def _load_sse_data():
+    """Load and cache the solid-state energy datasets."""
+    global _element_ssedata
+
+    if _element_ssedata is None:
+        data = {}
+        reader = csv.reader(_read_data_file(_SSE_PATH).splitlines())
+
+        for row in reader:
+            dataset = MappingProxyType(
+                {
+                    "AtomicNumber": int(row[1]),
+                    "SolidStateEnergy": float(row[2]),
+                    "IonisationPotential": float(row[3]),
+                    "ElectronAffinity": float(row[4]),
+                    "MullikenElectronegativity": float(row[5]),
+                    "SolidStateRenormalisationEnergy": float(row[6]),
+                }
+            )
+
+            data[sys.intern(row[0])] = dataset
+        _element_ssedata = data
+
+    return _element_ssedata
+
+
 def lookup_element_sse_data(symbol):
     """
     Retrieve the solid-state energy (SSE) data for an element.
@@ -672,7 +721,7 @@ def lookup_element_sse_data(symbol):
         list : SSE datasets for the element, or None
             if the element was not found among the external data.
 
-        SSE datasets are dictionaries with the keys:
+        SSE datasets are read-only dictionaries with the keys:
 
         AtomicNumber
             *int*
@@ -688,31 +737,12 @@ def lookup_element_sse_data(symbol):
             *float*
 
     """
-    global _element_ssedata
-
-    if _element_ssedata is None:
-        _element_ssedata = {}
-
-        with open(os.path.join(data_directory, "SSE.csv")) as file:
-            reader = csv.reader(file)
-
-            for row in reader:
-                dataset = {
-                    "AtomicNumber": int(row[1]),
-                    "SolidStateEnergy": float(row[2]),
-                    "IonisationPotential": float(row[3]),
-                    "ElectronAffinity": float(row[4]),
-                    "MullikenElectronegativity": float(row[5]),
-                    "SolidStateRenormalisationEnergy": float(row[6]),
-                }
-
-                _element_ssedata[row[0]] = dataset
-
-    if symbol in _element_ssedata:
-        return _element_ssedata[symbol]
+    dataset = (_element_ssedata or _load_sse_data()).get(symbol)
+    if dataset is not None:
+        return dataset
     else:
         if _print_warnings:
-            print(f"WARNING: Solid-state energy data for element {symbol} not" " found.")
+            logger.warning("Solid-state energy data for element %s not found.", symbol)
 
         return None
 
@@ -723,6 +753,31 @@ def lookup_element_sse_data(symbol):
 _element_sse2015_data = None
 
 
+def _load_sse2015_data():
+    """Load and cache the revised (2015) solid-state energy datasets."""
+    global _element_sse2015_data
+
+    if _element_sse2015_data is None:
+        data = defaultdict(list)
+        reader = csv.reader(_read_data_file(_SSE_2015_PATH).splitlines())
+
+        for row in reader:
+            # Elements can have multiple SSE values depending on
+            # their oxidation state
+
+            dataset = MappingProxyType(
+                {
+                    "OxidationState": int(row[1]),
+                    "SolidStateEnergy2015": float(row[2]),
+                }
+            )
+
+            data[sys.intern(row[0])].append(dataset)
+        _element_sse2015_data = dict(data)
+
+    return _element_sse2015_data
+
+
 def lookup_element_sse2015_data(symbol, copy=True):
     """
     Retrieve SSE (2015) data for element in oxidation state.
@@ -734,10 +789,10 @@ def lookup_element_sse2015_data(symbol, copy=True):
     Args:
     ----
         symbol : the atomic symbol of the element to look up.
-        copy: if True (default), return a copy of the data dictionary,
-        rather than a reference to a cached object -- only use
+        copy: if True (default), return a copy of the data dictionaries;
+        if False, return the cached list of read-only views -- only use
         copy=False in performance-sensitive code and where you are
-        certain the dictionary will not be modified!
+        certain the list will not be modified!
 
     Returns:
     -------
@@ -752,38 +807,66 @@ def lookup_element_sse2015_data(symbol, copy=True):
             *float* SSE2015
 
     """
-    global _element_sse2015_data
+    datasets = (_element_sse2015_data or _load_sse2015_data()).get(symbol)
+    if datasets is not None:
+        if copy:
+            return [dataset.copy() for dataset in datasets]
+        else:
+            return datasets
+    else:
+        if _print_warnings:
+            logger.warning("Solid-state energy (revised 2015) data for element %s not found.", symbol)
 
-    if _element_sse2015_data is None:
-        _element_sse2015_data = {}
+        return None
 
-        with open(os.path.join(data_directory, "SSE_2015.csv")) as file:
-            reader = csv.reader(file)
 
-            for row in reader:
-                # Elements can have multiple SSE values depending on
-                # their oxidation state
+# Cache of the revised (2015) SSE values, keyed by (symbol, oxidation state).
 
-                key = row[0]
+_element_sse2015_by_state = None
 
-                dataset = {
-                    "OxidationState": int(row[1]),
-                    "SolidStateEnergy2015": float(row[2]),
-                }
 
-                if key in _element_sse2015_data:
-                    _element_sse2015_data[key].append(dataset)
-                else:
-                    _element_sse2015_data[key] = [dataset]
+def _load_sse2015_by_state():
+    """Load and cache the revised (2015) SSE values by oxidation state."""
+    global _element_sse2015_by_state
 
-    if symbol in _element_sse2015_data:
-        if copy:
-            return [item.copy() for item in _element_sse2015_data[symbol]]
-        else:
-            return _element_sse2015_data[symbol]
+    if _element_sse2015_by_state is None:
+        _element_sse2015_by_state = {
+            (symbol, dataset["OxidationState"]): dataset["SolidStateEnergy2015"]
+            for symbol, datasets in (_element_sse2015_data or _load_sse2015_data()).items()
+            for dataset in datasets
+        }
+
+    return _element_sse2015_by_state
+
+
+def lookup_element_sse2015(symbol, oxidation_state):
+    """
+    Retrieve the SSE (2015) value for an element in an oxidation state.
+
+    A direct lookup into the data of lookup_element_sse2015_data, for
+    callers that only need the energy of one oxidation state.
+
+    Args:
+    ----
+        symbol (str) : the atomic symbol of the element to look up.
+        oxidation_state (int) : the oxidation state of the element.
+
+    Returns:
+    -------
+        float: SolidStateEnergy2015 for the element in the oxidation
+            state, or None if it was not found among the external data.
+
+    """
+    sse = (_element_sse2015_by_state or _load_sse2015_by_state()).get((symbol, oxidation_state))
+    if sse is not None:
+        return sse
     else:
         if _print_warnings:
-            print(f"WARNING: Solid-state energy (revised 2015) data for element {symbol} not found.")
+            logger.warning(
+                "Solid-state energy (revised 2015) data for element %s in oxidation state %s not found.",
+                symbol,
+                oxidation_state,
+            )
 
         return None
 
@@ -794,6 +877,23 @@ def lookup_element_sse2015_data(symbol, copy=True):
 _element_ssepauling_data = None
 
 
+def _load_sse_pauling_data():
+    """Load and cache the Pauling solid-state energy datasets."""
+    global _element_ssepauling_data
+
+    if _element_ssepauling_data is None:
+        data = {}
+        reader = csv.reader(_read_data_file(_SSE_PAULING_PATH).splitlines())
+
+        for row in reader:
+            dataset = MappingProxyType({"SolidStateEnergyPauling": float(row[1])})
+
+            data[sys.intern(row[0])] = dataset
+        _element_ssepauling_data = data
+
+    return _element_ssepauling_data
+
+
 def lookup_element_sse_pauling_data(symbol):
     """
     Retrieve Pauling SSE data.
@@ -807,32 +907,19 @@ def lookup_element_sse_pauling_data(symbol):
     ----
     symbol (str) : the atomic symbol of the element to look up.
 
-    Returns: A dictionary containing the SSE2015 dataset for the
+    Returns: A read-only dictionary containing the SSE2015 dataset for the
         element, or None if the element was not found among the external
         data.
 
     """
-    global _element_ssepauling_data
-
-    if _element_ssepauling_data is None:
-        _element_ssepauling_data = {}
-
-        with open(os.path.join(data_directory, "SSE_Pauling.csv")) as file:
-            reader = csv.reader(file)
-
-            for row in reader:
-                dataset = {"SolidStateEnergyPauling": float(row[1])}
-
-                _element_ssepauling_data[row[0]] = dataset
-
-    if symbol in _element_ssepauling_data:
-        return _element_ssepauling_data[symbol]
+    dataset = (_element_ssepauling_data or _load_sse_pauling_data()).get(symbol)
+    if dataset is not None:
+        return dataset
     else:
         if _print_warnings:
-            print(
-                "WARNING: Solid-state energy data from Pauling "
-                " electronegativity regression fit for "
-                f" element {symbol} not found."
+            logger.warning(
+                "Solid-state energy data from Pauling electronegativity regression fit for element %s not found.",
+                symbol,
             )
 
         return None
@@ -841,6 +928,54 @@ def lookup_element_sse_pauling_data(symbol):
 _element_magpie_data = None
 
 
+def _load_magpie_data():
+    """Load and cache the Magpie element data."""
+    global _element_magpie_data
+
+    if _element_magpie_data is None:
+        data = {}
+        reader = csv.reader(_read_data_file(_MAGPIE_PATH).splitlines())
+
+        # Skip the first row (headers).
+
+        next(reader)
+
+        for row in reader:
+            key = sys.intern(row[0])
+
+            # Integer-valued columns are written as floats (e.g. "1.0").
+            dataset = MappingProxyType(
+                {
+                    "Number": int(float(row[1])),
+                    "MendeleevNumber": int(float(row[2])),
+                    "AtomicWeight": float(row[3]),
+                    "MeltingT": float(row[4]),
+                    "Column": int(float(row[5])),
+                    "Row": int(float(row[6])),
+                    "CovalentRadius": float(row[7]),
+                    "Electronegativity": float(row[8]),
+                    "NsValence": int(float(row[9])),
+                    "NpValence": int(float(row[10])),
+                    "NdValence": int(float(row[11])),
+                    "NfValence": int(float(row[12])),
+                    "NValence": int(float(row[13])),
+                    "NsUnfilled": int(float(row[14])),
+                    "NpUnfilled": int(float(row[15])),
+                    "NdUnfilled": int(float(row[16])),
+                    "NfUnfilled": int(float(row[17])),
+                    "NUnfilled": int(float(row[18])),
+                    "GSvolume_pa": float(row[19]),
+                    "GSbandgap": float(row[20]),
+                    "GSmagmom": float(row[21]),
+                    "SpaceGroupNumber": int(float(row[22])),
+                }
+            )
+            data[key] = dataset
+        _element_magpie_data = data
+
+    return _element_magpie_data
+
+
 def lookup_element_magpie_data(symbol: str, copy: bool = True):
     """
     Retrieve element data contained in the Magpie representation.
@@ -853,10 +988,9 @@ def lookup_element_magpie_data(symbol: str, copy: bool = True):
 
     Args:
         symbol : the atomic symbol of the element to look up.
-        copy: if True (default), return a copy of the data dictionary,
-        rather than a reference to a cached object -- only use
-        copy=False in performance-sensitive code and where you are
-        certain the dictionary will not be modified!
+        copy: if True (default), return a copy of the data dictionary;
+        if False, return a read-only view of the cached object, which
+        avoids the copy in performance-sensitive code.
 
     Returns:
         list:
@@ -870,46 +1004,15 @@ def lookup_element_magpie_data(symbol: str, copy: bool = True):
 
 
     """
-    global _element_magpie_data
-
-    if _element_magpie_data is None:
-        _element_magpie_data = {}
-
-        df = pd.read_csv(os.path.join(data_directory, "magpie.csv"))
-        for _index, row in df.iterrows():
-            key = row.iloc[0]
-
-            dataset = {
-                "Number": int(row.iloc[1]),
-                "MendeleevNumber": int(row.iloc[2]),
-                "AtomicWeight": float(row.iloc[3]),
-                "MeltingT": float(row.iloc[4]),
-                "Column": int(row.iloc[5]),
-                "Row": int(row.iloc[6]),
-                "CovalentRadius": float(row.iloc[7]),
-                "Electronegativity": float(row.iloc[8]),
-                "NsValence": int(row.iloc[9]),
-                "NpValence": int(row.iloc[10]),
-                "NdValence": int(row.iloc[11]),
-                "NfValence": int(row.iloc[12]),
-                "NValence": int(row.iloc[13]),
-                "NsUnfilled": int(row.iloc[14]),
-                "NpUnfilled": int(row.iloc[15]),
-                "NdUnfilled": int(row.iloc[16]),
-                "NfUnfilled": int(row.iloc[17]),
-                "NUnfilled": int(row.iloc[18]),
-                "GSvolume_pa": float(row.iloc[19]),
-                "GSbandgap": float(row.iloc[20]),
-                "GSmagmom": float(row.iloc[21]),
-                "SpaceGroupNumber": int(row.iloc[22]),
-            }
-            _element_magpie_data[key] = dataset
-
-    if symbol in _element_magpie_data:
-        return _element_magpie_data[symbol]
+    dataset = (_element_magpie_data or _load_magpie_data()).get(symbol)
+    if dataset is not None:
+        if copy:
+            return dataset.copy()
+        else:
+            return dataset
     else:
         if _print_warnings:
-            print(f"WARNING: Magpie data for element {symbol} not " "found.")
+            logger.warning("Magpie data for element %s not found.", symbol)
 
         return None
 
@@ -917,6 +1020,28 @@ def lookup_element_magpie_data(symbol: str, copy: bool = True):
 _element_valence_data = None
 
 
+def _load_valence_data():
+    """Load and cache the valence electron data."""
+    global _element_valence_data
+
+    if _element_valence_data is None:
+        data = {}
+        reader = csv.reader(_read_data_file(_VALENCE_PATH).splitlines())
+
+        # Skip the first row (headers).
+
+        next(reader)
+
+        for row in reader:
+            key = sys.intern(row[0])
+
+            dataset = MappingProxyType({"NValence": int(row[1])})
+            data[key] = dataset
+        _element_valence_data = data
+
+    return _element_valence_data
+
+
 def lookup_element_valence_data(symbol: str, copy: bool = True):
     """
     Retrieve valence electron data.
@@ -928,32 +1053,231 @@ def lookup_element_valence_data(symbol: str, copy: bool = True):
 
     Args:
         symbol : the atomic symbol of the element to look up.
-        copy: if True (default), return a copy of the data dictionary,
-        rather than a reference to a cached object -- only use
-        copy=False in performance-sensitive code and where you are
-        certain the dictionary will not be modified!
+        copy: if True (default), return a copy of the data dictionary;
+        if False, return a read-only view of the cached object, which
+        avoids the copy in performance-sensitive code.
 
     Returns:
         NValence (int): the number of valence electrons
         Returns None if the element was not found among the external
         data.
     """
-    global _element_valence_data
+    dataset = (_element_valence_data or _load_valence_data()).get(symbol)
+    if dataset is not None:
+        if copy:
+            return dataset.copy()
+        else:
+            return dataset
+    else:
+        if _print_warnings:
+            logger.warning("Valence data for element %s not found.", symbol)
 
-    if _element_valence_data is None:
-        _element_valence_data = {}
+        return None
 
-        df = pd.read_csv(os.path.join(data_directory, "element_valence_modified.csv"))
-        for _index, row in df.iterrows():
-            key = row.iloc[0]
 
-            dataset = {"NValence": int(row.iloc[1])}
-            _element_valence_data[key] = dataset
+# Column-oriented copies of the element data and Magpie tables, for
+# callers that need one property for many elements at once.
 
-    if symbol in _element_valence_data:
-        return _element_valence_data[symbol]
-    else:
-        if _print_warnings:
-            print(f"WARNING: Valence data for element {symbol} not " "found.")
+_element_data_columns = None
+_element_magpie_columns = None
 
-        return None
+
+def _build_columns(table):
+    """Transpose a {symbol: row} table into a symbol index and one array per column."""
+    index = {symbol: i for i, symbol in enumerate(table)}
+    rows = list(table.values())
+    columns = {}
+    for key in rows[0]:
+        # Missing numerical values (None) become NaN.
+        column = np.array([np.nan if row[key] is None else row[key] for row in rows])
+        column.flags.writeable = False
+        columns[key] = column
+
+    return index, columns
+
+
+def _load_element_data_columns():
+    """Load and cache the column-oriented element data."""
+    global _element_data_columns
+
+    if _element_data_columns is None:
+        _element_data_columns = _build_columns(_element_data or _load_element_data())
+
+    return _element_data_columns
+
+
+def _load_magpie_columns():
+    """Load and cache the column-oriented Magpie data."""
+    global _element_magpie_columns
+
+    if _element_magpie_columns is None:
+        _element_magpie_columns = _build_columns(_element_magpie_data or _load_magpie_data())
+
+    return _element_magpie_columns
+
+
+def _lookup_column(index, columns, column, symbols):
+    """Select the rows of a column for a sequence of symbols."""
+    values = columns[column]
+    if symbols is None:
+        return values
+    return values[[index[symbol] for symbol in symbols]]
+
+
+def lookup_element_data_column(column, symbols=None):
+    """
+    Retrieve one column of the tabulated elemental data as an array.
+
+    Args:
+    ----
+        column (str) : column heading from data/element_data.txt,
+            e.g. "el_neg".
+        symbols (Optional(iterable)) : atomic symbols to look up. If
+            None (default), return the column for every element, in
+            the order of the data file.
+
+    Returns:
+    -------
+        numpy.ndarray: Values of the column, aligned with symbols.
+            Missing numerical data are NaN. The full column is a
+            read-only view of the cached data.
+
+    Raises:
+    ------
+        KeyError: if the column or one of the symbols is not in the table.
+
+    """
+    return _lookup_column(*(_element_data_columns or _load_element_data_columns()), column, symbols)
+
+
+def lookup_element_magpie_column(column, symbols=None):
+    """
+    Retrieve one column of the Magpie element data as an array.
+
+    Args:
+    ----
+        column (str) : Magpie feature name, e.g. "MendeleevNumber".
+        symbols (Optional(iterable)) : atomic symbols to look up. If
+            None (default), return the column for every element, in
+            the order of the data file.
+
+    Returns:
+    -------
+        numpy.ndarray: Values of the column, aligned with symbols. The
+            full column is a read-only view of the cached data.
+
+    Raises:
+    ------
+        KeyError: if the column or one of the symbols is not in the table.
+
+    """
+    return _lookup_column(*(_element_magpie_columns or _load_magpie_columns()), column, symbols)
+
+
+def _lookup_many(index, columns, symbols):
+    """Select the rows of every column for a sequence of symbols."""
+    rows = [index[symbol] for symbol in symbols]
+    return {column: values[rows] for column, values in columns.items()}
+
+
+def lookup_element_data_many(symbols):
+    """
+    Retrieve tabulated data for several elements in one call.
+
+    Args:
+    ----
+        symbols (iterable) : atomic symbols to look up.
+
+    Returns:
+    -------
+        dict: numpy arrays of the data, keyed by column headings from
+            data/element_data.txt and aligned with symbols. Missing
+            numerical data are NaN. Pass the result to
+            pandas.DataFrame for a table with one row per symbol.
+
+    Raises:
+    ------
+        KeyError: if one of the symbols is not in the table.
+
+    """
+    return _lookup_many(*(_element_data_columns or _load_element_data_columns()), symbols)
+
+
+def lookup_element_magpie_data_many(symbols):
+    """
+    Retrieve Magpie element data for several elements in one call.
+
+    Args:
+    ----
+        symbols (iterable) : atomic symbols to look up.
+
+    Returns:
+    -------
+        dict: numpy arrays of the Magpie features, keyed by feature
+            name and aligned with symbols.
+
+    Raises:
+    ------
+        KeyError: if one of the symbols is not in the table.
+
+    """
+    return _lookup_many(*(_element_magpie_columns or _load_magpie_columns()), symbols)
+
+
+def preload():
+    """
+    Load all of the bundled data tables up front.
+
+    The tables are otherwise loaded lazily, the first time each one is
+    looked up. The data files are independent of each other, so they
+    are read and parsed on a thread pool. This is useful before timing
+    a screening run, or before sharing the module between worker
+    threads.
+    """
+    loaders = (
+        *(functools.partial(_load_oxidation_states, source) for source in _OXIDATION_STATES_PATHS),
+        _load_hhis,
+        _load_element_data,
+        _load_shannon_radii,
+        _load_shannon_radii_extendedML,
+        _load_sse_data,
+        _load_sse2015_data,
+        _load_sse_pauling_data,
+        _load_magpie_data,
+        _load_valence_data,
+    )
+    with ThreadPoolExecutor() as executor:
+        # Consume the results so that any exception from a loader is raised here.
+        list(executor.map(lambda loader: loader(), loaders))
+
+
+def reset_cache():
+    """
+    Clear all cached data so that it is re-read on the next lookup.
+
+    The data files are only read once per session; call this after
+    editing one of them (e.g. a custom oxidation-states file) or
+    to restore a clean state between tests.
+    """
+    global _element_hhis, _element_data
+    global _element_shannon_radii_data, _element_shannon_radii_data_extendedML
+    global _element_ssedata, _element_sse2015_data, _element_sse2015_by_state, _element_ssepauling_data
+    global _element_magpie_data, _element_valence_data
+    global _element_data_columns, _element_magpie_columns
+
+    _read_data_file.cache_clear()
+
+    _el_ox_states.clear()
+    _el_ox_states_custom.clear()
+    _element_hhis = None
+    _element_data = None
+    _element_shannon_radii_data = None
+    _element_shannon_radii_data_extendedML = None
+    _element_ssedata = None
+    _element_sse2015_data = None
+    _element_sse2015_by_state = None
+    _element_ssepauling_data = None
+    _element_magpie_data = None
+    _element_valence_data = None
+    _element_data_columns = None
+    _element_magpie_columns = None
@@ -11,9 +11,7 @@ for equivalence.
 
 from __future__ import annotations
 
-import copy
-
-import smact
+import numpy as np
 
 try:
     from pyspglib import spglib
@@ -26,6 +24,11 @@ except ImportError:
 from ase.spacegroup import Spacegroup
 
 
+def _matching_sites(sites, site, tolerance=1e-4):
+    """Mask of the rows of sites within tolerance of site in every coordinate, as smact.are_eq."""
+    return (np.abs(sites - np.asarray(site)) <= tolerance).all(axis=1)
+
+
 def get_sg(lattice):
     """
     Get the space-group of the system.
@@ -61,21 +64,14 @@ def get_inequivalent_sites(sub_lattice, lattice):
     """
     sg = get_sg(lattice)
     inequivalent_sites = []
+    # The inequivalent sites found so far and their symmetry related sites, stacked
+    # so that each candidate site is checked against all of them in one comparison
+    known_sites = np.empty((0, 3))
     for site in sub_lattice:
-        new_site = True
-        # Check against the existing members of the list of inequivalent sites
-        if len(inequivalent_sites) > 0:
-            for inequiv_site in inequivalent_sites:
-                if smact.are_eq(site, inequiv_site) is True:
-                    new_site = False
-                # Check against symmetry related members of the list of inequivalent sites
-                equiv_inequiv_sites, _ = sg.equivalent_sites(inequiv_site)
-                for equiv_inequiv_site in equiv_inequiv_sites:
-                    if smact.are_eq(site, equiv_inequiv_site) is True:
-                        new_site = False
-
-        if new_site is True:
+        if not _matching_sites(known_sites, site).any():
             inequivalent_sites.append(site)
+            equiv_sites, _ = sg.equivalent_sites(site)
+            known_sites = np.vstack((known_sites, [site], equiv_sites))
 
     return inequivalent_sites
 
@@ -95,15 +91,13 @@ def make_substitution(lattice, site, new_species):
         lattice
 
     """
-    i = 0
-    # NBNBNBNB  It is necessary to use deepcopy for objects, otherwise changes applied to a clone
-    # will also apply to the parent object.
-    new_lattice = copy.deepcopy(lattice)
-    lattice_sites = new_lattice.get_scaled_positions()
-    for lattice_site in lattice_sites:
-        if smact.are_eq(lattice_site, site):
-            new_lattice[i].symbol = new_species
-        i = i + 1
+    # NBNBNBNB  It is necessary to copy the lattice, otherwise changes applied to a clone
+    # will also apply to the parent object. Atoms.copy() copies the atomic arrays, cell
+    # and constraints without a generic deepcopy of the whole object.
+    new_lattice = lattice.copy()
+    # Match every lattice site against the substitution site at once
+    matches = _matching_sites(new_lattice.get_scaled_positions(), site)
+    new_lattice.symbols[matches] = new_species
     return new_lattice
 
 
@@ -122,12 +116,6 @@ def build_sub_lattice(lattice, symbol):
             sub_lattice: Cartesian coordinates of the sub-lattice of symbol
 
     """
-    sub_lattice = []
-    i = 0
-    atomic_labels = lattice.get_chemical_symbols()
+    atomic_labels = np.asarray(lattice.get_chemical_symbols())
     positions = lattice.get_scaled_positions()
-    for atom in atomic_labels:
-        if atom == symbol:
-            sub_lattice.append(positions[i])
-        i = i + 1
-    return sub_lattice
+    return list(positions[atomic_labels == symbol])
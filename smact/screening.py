@@ -400,7 +400,7 @@ def smact_filter(
     if oxidation_states_set in oxi_set:
         ox_combos = oxi_set[oxidation_states_set]
     elif os.path.exists(oxidation_states_set):
-        ox_combos = [oxi_custom(e.symbol, oxidation_states_set) for e in els]
+        ox_combos = [oxi_custom(e.symbol, oxidation_states_set, copy=False) for e in els]
     else:
         raise (
             Exception(
@@ -493,7 +493,7 @@ def smact_validity(
     elif oxidation_states_set == "icsd24" or oxidation_states_set is None:  # Default
         ox_combos = [e.oxidation_states_icsd24 for e in smact_elems]
     elif os.path.exists(oxidation_states_set):
-        ox_combos = [oxi_custom(e.symbol, oxidation_states_set) for e in smact_elems]
+        ox_combos = [oxi_custom(e.symbol, oxidation_states_set, copy=False) for e in smact_elems]
     elif oxidation_states_set == "wiki":
         warnings.warn(
             "This set of oxidation states is sourced from Wikipedia. The results from using this set could be questionable and should not be used unless you know what you are doing and have inspected the oxidation states.",
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import os
+import tempfile
 import unittest
 
 import pytest
@@ -425,6 +426,97 @@ class TestSequenceFunctions(unittest.TestCase):
         self.assertAlmostEqual(wurtz[0], 5.13076)
         self.assertAlmostEqual(wurtz[2], 8.3838)
 
+    # ---------- smact.data_loader module -----------
+    def test_data_loader_reset_cache(self):
+        lookup = smact.data_loader.lookup_element_oxidation_states_custom
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            ox_file = os.path.join(tmp_dir, "ox_states.txt")
+            with open(ox_file, "w") as f:
+                f.write("# Custom set\n\nRb +1\n")
+            smact.data_loader.reset_cache()
+            self.assertEqual(lookup("Rb", ox_file), [1])
+
+            # Edits to the file are only picked up once the cache is cleared
+            with open(ox_file, "w") as f:
+                f.write("# Custom set\nRb -1 +1\n")
+            self.assertEqual(lookup("Rb", ox_file), [1])
+            smact.data_loader.reset_cache()
+            self.assertEqual(lookup("Rb", ox_file), [-1, 1])
+
+            # Each custom file is cached separately
+            other_file = os.path.join(tmp_dir, "other_ox_states.txt")
+            with open(other_file, "w") as f:
+                f.write("Rb +2\n")
+            self.assertEqual(lookup("Rb", other_file), [2])
+            self.assertEqual(lookup("Rb", ox_file), [-1, 1])
+        smact.data_loader.reset_cache()
+
+    def test_data_loader_preload(self):
+        smact.data_loader.reset_cache()
+        smact.data_loader.preload()
+        self.assertEqual(smact.data_loader.lookup_element_hhis("Fe"), (2400.0, 1400.0))
+        self.assertEqual(smact.data_loader.lookup_element_oxidation_states_icsd24("Rb"), [1])
+        self.assertEqual(smact.data_loader.lookup_element_valence_data("Fe")["NValence"], 8)
+
+    def test_data_loader_warnings(self):
+        smact.data_loader.set_warnings(True)
+        try:
+            with self.assertLogs("smact.data_loader", level="WARNING") as logs:
+                self.assertIsNone(smact.data_loader.lookup_element_hhis("Xx"))
+        finally:
+            smact.data_loader.set_warnings(False)
+        self.assertIn("Xx", logs.output[0])
+
+    def test_lookup_element_sse2015(self):
+        for dataset in smact.data_loader.lookup_element_sse2015_data("Fe"):
+            self.assertEqual(
+                smact.data_loader.lookup_element_sse2015("Fe", dataset["OxidationState"]),
+                dataset["SolidStateEnergy2015"],
+            )
+        self.assertIsNone(smact.data_loader.lookup_element_sse2015("Fe", 9))
+
+    def test_lookup_element_oxidation_states_by_source(self):
+        lookup = smact.data_loader.lookup_element_oxidation_states_by_source
+        self.assertEqual(lookup("Rb"), [1])
+        self.assertEqual(lookup("Rb", copy=False), (1,))
+        self.assertEqual(lookup("Rb", "smact14"), smact.data_loader.lookup_element_oxidation_states("Rb"))
+        self.assertEqual(lookup("Fe", "wiki"), smact.data_loader.lookup_element_oxidation_states_wiki("Fe"))
+        self.assertIsNone(lookup("Xx", "icsd16"))
+        with pytest.raises(ValueError):
+            lookup("Fe", "not_a_set")
+        self.assertEqual(
+            smact.data_loader.lookup_element_oxidation_states_many(["Rb", "Xx", "Fe"], "wiki"),
+            [lookup("Rb", "wiki"), None, lookup("Fe", "wiki")],
+        )
+
+    def test_data_loader_read_only_cache(self):
+        cached = smact.data_loader.lookup_element_data("Fe", copy=False)
+        with pytest.raises(TypeError):
+            cached["Mass"] = 0.0
+        data = smact.data_loader.lookup_element_data("Fe")
+        data["Mass"] = 0.0
+        self.assertNotEqual(cached["Mass"], 0.0)
+        with pytest.raises(TypeError):
+            smact.data_loader.lookup_element_magpie_data("Fe", copy=False)["NValence"] = 0
+        radii = smact.data_loader.lookup_element_shannon_radius_data("Fe")
+        self.assertIsInstance(radii[0], dict)
+        self.assertEqual(radii, smact.data_loader.lookup_element_shannon_radius_data("Fe", copy=False))
+
+    def test_lookup_element_columns(self):
+        masses = smact.data_loader.lookup_element_data_column("Mass", ["Fe", "O"])
+        self.assertEqual(list(masses), [smact.Element("Fe").mass, smact.Element("O").mass])
+        self.assertEqual(len(smact.data_loader.lookup_element_data_column("Z")), 103)
+        self.assertEqual(smact.data_loader.lookup_element_magpie_column("NValence", ["Fe"])[0], 8)
+        with pytest.raises(KeyError):
+            smact.data_loader.lookup_element_data_column("Mass", ["Xx"])
+
+    def test_lookup_element_data_many(self):
+        data = smact.data_loader.lookup_element_data_many(["O", "Fe"])
+        self.assertEqual(list(data["Symbol"]), ["O", "Fe"])
+        self.assertEqual(data["Mass"][1], smact.data_loader.lookup_element_data("Fe")["Mass"])
+        magpie = smact.data_loader.lookup_element_magpie_data_many(["Fe"])
+        self.assertEqual(magpie["MendeleevNumber"][0], smact.Element("Fe").mendeleev)
+
     # ---------- smact.oxidation_states module -----------
     def test_oxidation_states(self):
         ox = smact.oxidation_states.Oxidation_state_probability_finder()